@@ -1,18 +1,42 @@
 #!/usr/bin/env python3
-import json
 import re
 import sys
 import os
 from datetime import date, datetime, timezone
 from urllib.parse import urljoin
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (C-backed parser; much faster than html.parser)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 BASE = "https://www.churchofjesuschrist.org"
 MANUAL_PATH = "/study/manual/come-follow-me-for-home-and-church-old-testament-2026/{week:02d}?lang=eng"
 OUT_JSON = "data/come_follow_me_this_week.json"
 
+# Only build the parts of the page we read (headings + content/images).
+# Skips <head>, scripts, styles, nav chrome, etc.
+PARSE_ONLY = SoupStrainer(["main", "article", "p", "h1", "picture", "figure", "img"])
+
+_SRCSET_RE = re.compile(r"(\S+)\s+(\d+)w")
+
+# Shared session: connection pooling + keep-alive, retries on transient 5xx
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; SnowCanyonWardBot/1.0; +https://github.com/kdidso)"
+})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])),
+)
+
 
 def iso_week_number(d: date) -> int:
     """
@@ -40,16 +64,20 @@ def _largest_from_srcset(srcset: str) -> str:
     """
     if not srcset:
         return ""
-    candidates = []
+    # Single candidate (common for hero images): nothing to compare
+    if "," not in srcset:
+        tok = srcset.strip().split()
+        return tok[0] if tok else ""
+    best_w, best_url = -1, ""
     for part in srcset.split(","):
         part = part.strip()
-        m = re.match(r"(\S+)\s+(\d+)w", part)
+        m = _SRCSET_RE.match(part)
         if m:
-            candidates.append((int(m.group(2)), m.group(1)))
-    if not candidates:
-        return ""
-    candidates.sort(key=lambda x: x[0])
-    return candidates[-1][1]
+            w = int(m.group(2))
+            # >= keeps the last of equal widths (same as the old stable sort)
+            if w >= best_w:
+                best_w, best_url = w, m.group(1)
+    return best_url
 
 
 def pick_best_image_from_tag(img_tag) -> str:
@@ -125,6 +153,16 @@ def _pick_from_picture_tag(picture_tag) -> str:
     return pick_best_image_from_tag(img)
 
 
+def _find_in_order(root, sel: str) -> list:
+    """
+    find()/find_all() equivalents of the simple selectors pick_top_image scans
+    ("picture", "figure img", "img"); skips soupsieve's CSS compile per call.
+    """
+    if sel == "figure img":
+        return [img for fig in root.find_all("figure") for img in fig.find_all("img")]
+    return root.find_all(sel)
+
+
 def pick_top_image(soup: BeautifulSoup) -> str:
     """
     Find the image that is highest up on the page (DOM order),
@@ -134,7 +172,7 @@ def pick_top_image(soup: BeautifulSoup) -> str:
     This is much more reliable than fixed IDs since the site changes.
     """
     # Prefer searching within main/article content first
-    containers = soup.select("main, article")
+    containers = soup.find_all(["main", "article"])
     search_roots = containers if containers else [soup]
 
     seen = set()
@@ -144,7 +182,7 @@ def pick_top_image(soup: BeautifulSoup) -> str:
 
     for root in search_roots:
         for sel in selectors:
-            for el in root.select(sel):
+            for el in _find_in_order(root, sel):
                 if el.name == "picture":
                     url = _pick_from_picture_tag(el)
                 elif el.name == "img":
@@ -169,7 +207,7 @@ def pick_top_image(soup: BeautifulSoup) -> str:
 
     # If nothing found in main/article, try whole document (as last resort)
     for sel in selectors:
-        for el in soup.select(sel):
+        for el in _find_in_order(soup, sel):
             if el.name == "picture":
                 url = _pick_from_picture_tag(el)
             elif el.name == "img":
@@ -197,24 +235,17 @@ def pick_top_image(soup: BeautifulSoup) -> str:
 def scrape_week(week: int) -> dict:
     url = BASE + MANUAL_PATH.format(week=week)
 
-    r = requests.get(
-        url,
-        timeout=30,
-        headers={
-            "User-Agent": "Mozilla/5.0 (compatible; SnowCanyonWardBot/1.0; +https://github.com/kdidso)"
-        },
-    )
+    r = _SESSION.get(url, timeout=30)
     r.raise_for_status()
 
-    # Force correct decoding so curly quotes / dashes survive
-    r.encoding = "utf-8"
-
-    soup = BeautifulSoup(r.text, "html.parser")
+    # Hand the parser the raw bytes (no r.text decode/copy); pin UTF-8 so
+    # curly quotes / dashes survive even without a charset header
+    soup = BeautifulSoup(r.content, HTML_PARSER, parse_only=PARSE_ONLY, from_encoding="utf-8")
 
     # Small heading is typically p.title-number
-    small_heading_el = soup.select_one("p.title-number")
+    small_heading_el = soup.find("p", class_="title-number")
     # Big heading is typically the first h1
-    big_heading_el = soup.select_one("h1")
+    big_heading_el = soup.find("h1")
 
     small_heading = get_text_or_empty(small_heading_el)
     big_heading = get_text_or_empty(big_heading_el)
@@ -244,8 +275,8 @@ def main():
 
     os.makedirs(os.path.dirname(OUT_JSON), exist_ok=True)
 
-    with open(OUT_JSON, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    with open(OUT_JSON, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     print(f"Wrote {OUT_JSON} for week {week}: {payload.get('big_heading','')}")
 
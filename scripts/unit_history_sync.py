@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 import os
 import re
-import json
 import time
 import zipfile
+import functools
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 
+import httpx
+import orjson
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
 
 BASE = "https://unithistory.churchofjesuschrist.org"
@@ -23,18 +26,35 @@ MANIFEST_PATH = os.getenv("MANIFEST_PATH", "unit-history/manifest.json").strip()
 HEADLESS = os.getenv("HEADLESS", "1").strip().lower() not in ("0", "false", "no", "")
 SKIP_EXISTING_FOLDERS = os.getenv("SKIP_EXISTING_FOLDERS", "1").strip().lower() not in ("0", "false", "no", "")
 
+# DOM srcset candidates at least this wide are treated as full-size
+# (lets us skip the slow lightbox walk)
+FULLSIZE_MIN_WIDTH = int(os.getenv("FULLSIZE_MIN_WIDTH", "1200").strip() or "1200")
+
+# Concurrent image downloads per story
+DOWNLOAD_WORKERS = int(os.getenv("DOWNLOAD_WORKERS", "10").strip() or "10")
+
 # Auth env (username/password only)
 LDS_USERNAME = os.getenv("LDS_USERNAME", "").strip()
 LDS_PASSWORD = os.getenv("LDS_PASSWORD", "").strip()
 
+_SRCSET_RE = re.compile(r"(\S+)\s+(\d+)w")
+_UNSAFE_RE = re.compile(r'[\\/:*?"<>|]+')  # Windows-unsafe filename chars
+_WS_RE = re.compile(r"\s+")
+# Month name anywhere in a string (story date, e.g. "Oct 18, 2025")
+_DATE_RE = re.compile(
+    r"\b(?:Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August"
+    r"|Sep|Sept|September|Oct|October|Nov|November|Dec|December)\b",
+    re.I,
+)
+
 
 # ---------------------------
 # Utilities
 # ---------------------------
 def safe_name(name: str, max_len: int = 90) -> str:
     name = (name or "").strip()
-    name = re.sub(r"\s+", " ", name)
-    name = re.sub(r'[\\/:*?"<>|]+', "-", name)  # Windows-safe
+    name = _WS_RE.sub(" ", name)
+    name = _UNSAFE_RE.sub("-", name)  # Windows-safe
     name = name.strip(" .")
     if not name:
         name = "Untitled"
@@ -61,35 +81,46 @@ def save_debug(page, tag="debug"):
     print(f"🧭 Current URL:            {getattr(page, 'url', '')}")
 
 
+@functools.lru_cache(maxsize=4096)
 def absolutize(href: str) -> str:
     if not href:
         return ""
     return urljoin(BASE, href)
 
 
-def pick_largest_from_srcset(srcset: str) -> str:
+def largest_srcset_candidate(srcset: str) -> tuple[int, str]:
     """
     srcset: "url1 480w, url2 800w, url3 1200w"
-    return url with the largest width. If no widths, return first URL.
+    return (width, url) for the largest width. Entries without a width count as 0.
     """
     if not srcset:
-        return ""
-    parts = [p.strip() for p in srcset.split(",") if p.strip()]
-    candidates = []
-    for p in parts:
-        m = re.match(r"(\S+)\s+(\d+)w", p)
+        return 0, ""
+    best_w, best_url = -1, ""
+    for p in srcset.split(","):
+        p = p.strip()
+        if not p:
+            continue
+        m = _SRCSET_RE.match(p)
         if m:
-            candidates.append((int(m.group(2)), m.group(1)))
+            w, u = int(m.group(2)), m.group(1)
         else:
             tok = p.split()
-            if tok:
-                candidates.append((0, tok[0]))
-    if not candidates:
-        return ""
-    candidates.sort(key=lambda x: x[0])
-    return candidates[-1][1]
+            w, u = 0, tok[0]
+        # >= keeps the last of equal widths (same as the old stable sort)
+        if w >= best_w:
+            best_w, best_url = w, u
+    return max(best_w, 0), best_url
+
+
+def pick_largest_from_srcset(srcset: str) -> str:
+    """
+    srcset: "url1 480w, url2 800w, url3 1200w"
+    return url with the largest width. If no widths, return first URL.
+    """
+    return largest_srcset_candidate(srcset)[1]
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_img_url(u: str) -> str:
     if not u:
         return ""
@@ -101,10 +132,31 @@ def normalize_img_url(u: str) -> str:
     return u
 
 
-def scroll_to_load(page, max_scrolls=18, pause_ms=350):
+def scroll_to_load(page, max_scrolls=18, pause_ms=350, grow_timeout_ms=1500):
+    """
+    Scroll down to trigger lazy-loaded content. Stops once we're at the bottom
+    and the page hasn't grown within grow_timeout_ms, instead of always doing
+    max_scrolls steps.
+    """
     for _ in range(max_scrolls):
         page.mouse.wheel(0, 1800)
+        # wheel() doesn't wait for the scroll; let it land and lazy images kick off
         page.wait_for_timeout(pause_ms)
+        try:
+            h, bottom = page.evaluate(
+                "() => [document.body.scrollHeight, window.scrollY + window.innerHeight]"
+            )
+        except Exception:
+            break
+        if bottom < h:
+            continue
+        # At the bottom: give lazily appended content a bounded chance to extend the page
+        try:
+            page.wait_for_function(
+                "(h) => document.body.scrollHeight > h", arg=h, timeout=grow_timeout_ms
+            )
+        except PWTimeoutError:
+            break
     page.evaluate("() => window.scrollTo(0, 0)")
     page.wait_for_timeout(250)
 
@@ -128,7 +180,7 @@ def is_login_page(page) -> bool:
         return True
 
     # DOM-based detection (more reliable than URL alone)
-    if _has_any(page, "#username-input") or _has_any(page, "#password-input"):
+    if _has_any(page, "#username-input, #password-input"):
         return True
 
     # Sometimes an interstitial challenge doesn't show those IDs; look for common sign-in headings
@@ -141,6 +193,7 @@ def is_login_page(page) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=4096)
 def file_ext_from_url(url: str) -> str:
     path = urlparse(url).path
     ext = os.path.splitext(path)[1].lower()
@@ -149,6 +202,7 @@ def file_ext_from_url(url: str) -> str:
     return ".jpg"
 
 
+@functools.lru_cache(maxsize=4096)
 def strip_downscaling_params(url: str) -> str:
     """
     Some CDNs/thumb services add params like w/h/width/height/fit/quality etc.
@@ -184,11 +238,25 @@ def ensure_dir(p: pathlib.Path):
     p.mkdir(parents=True, exist_ok=True)
 
 
+def write_json(path, obj):
+    # orjson writes UTF-8 as-is (same output as ensure_ascii=False, indent=2), much faster
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+# Already-compressed media: deflating these burns CPU for ~0% size gain
+STORED_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic"}
+
+
 def zip_folder(root: pathlib.Path, zip_name: str):
     ensure_dir(pathlib.Path(zip_name).parent)
-    with zipfile.ZipFile(zip_name, "w", compression=zipfile.ZIP_DEFLATED) as z:
+    with zipfile.ZipFile(zip_name, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as z:
         for p in root.rglob("*"):
-            if p.is_file():
+            if not p.is_file():
+                continue
+            if p.suffix.lower() in STORED_EXTS:
+                z.write(p, p.relative_to(root), compress_type=zipfile.ZIP_STORED)
+            else:
                 z.write(p, p.relative_to(root))
     print(f"📦 Wrote zip: {zip_name}")
 
@@ -197,14 +265,14 @@ def zip_folder(root: pathlib.Path, zip_name: str):
 # Auth helpers (UPDATED)
 # ---------------------------
 def _click_first_that_exists(page, selectors, timeout_ms=10_000) -> bool:
-    for sel in selectors:
-        try:
-            loc = page.locator(sel).first
-            if loc.count() > 0:
-                loc.click(timeout=timeout_ms)
-                return True
-        except Exception:
-            continue
+    # One OR'd selector = one probe, instead of a count() round-trip per selector
+    try:
+        loc = page.locator(", ".join(selectors)).first
+        if loc.count() > 0:
+            loc.click(timeout=timeout_ms)
+            return True
+    except Exception:
+        pass
     return False
 
 
@@ -357,116 +425,182 @@ def get_story_card_count(page) -> int:
     return page.locator(STORY_CARD_SELECTOR).count()
 
 
-def get_card_title(card_locator) -> str:
-    for sel in ["h2", "h3", "[role='heading']"]:
-        try:
-            t = card_locator.locator(sel).first.inner_text(timeout=500).strip()
-            if t:
-                return t
-        except Exception:
-            pass
+def get_story_card_hrefs(page) -> list[str]:
+    """
+    One pass over the grid: each card's link ("" when the card has no <a>,
+    e.g. a JS-only click handler). Aligned with the card order.
+    """
+    return page.evaluate("""
+      (sel) => Array.from(document.querySelectorAll(sel)).map(c => {
+        const a = c.closest('a[href]') || c.querySelector('a[href]');
+        return a ? a.href : '';
+      })
+    """, STORY_CARD_SELECTOR)
 
-    for sel in ["strong", "b"]:
-        try:
-            t = card_locator.locator(sel).first.inner_text(timeout=500).strip()
-            if t:
-                return t
-        except Exception:
-            pass
 
+def open_story_by_click(page, i: int) -> bool:
+    """
+    Fallback for cards without a link: reload the grid and click card i.
+    """
+    open_story_grid(page)
+
+    cards = page.locator(STORY_CARD_SELECTOR)
+    if i >= cards.count():
+        print("⚠️  Card count changed after reload; skipping.")
+        return False
+
+    card = cards.nth(i)
     try:
-        a = card_locator.get_attribute("aria-label") or ""
-        if a.strip():
-            return a.strip()
+        card.click(timeout=20_000)
+        return True
     except Exception:
         pass
 
     try:
-        txt = card_locator.inner_text(timeout=1000).strip()
-        txt = re.sub(r"\s+", " ", txt)
-        if txt:
-            return txt[:80]
+        card.locator("a").first.click(timeout=20_000)
+        return True
     except Exception:
-        pass
+        return False
 
-    return "Untitled"
+
+def get_card_titles(page) -> list[str]:
+    """
+    Every card's title in one round-trip, same priority as before:
+    h2, h3, [role=heading], strong, b (first non-empty), else aria-label,
+    else the card text (trimmed to 80 chars).
+    """
+    titles = page.evaluate(r"""
+      (sel) => Array.from(document.querySelectorAll(sel)).map(c => {
+        for (const hs of ["h2", "h3", "[role='heading']", "strong", "b"]) {
+          const h = c.querySelector(hs);
+          const t = h ? (h.innerText || '').trim() : '';
+          if (t) return t;
+        }
+        const a = (c.getAttribute('aria-label') || '').trim();
+        if (a) return a;
+        return (c.innerText || '').replace(/\s+/g, ' ').trim().slice(0, 80);
+      })
+    """, STORY_CARD_SELECTOR)
+    return [(t or "").strip() or "Untitled" for t in titles]
 
 
 # ---------------------------
 # Story page: extract images + metadata
 # ---------------------------
-def extract_image_urls_from_dom(page) -> list[str]:
+def extract_image_urls_from_dom(page, min_width: int = 0) -> list[str]:
+    """
+    All image URLs referenced by <img>/<picture> on the page (srcsets reduced to
+    their largest candidate). With min_width, only srcset candidates at least
+    that wide are returned.
+    """
     raw = page.evaluate("""
       () => {
-        const urls = new Set();
+        // value -> true if it came from a srcset attribute
+        const urls = new Map();
+        const add = (v, isSrcset) => { if (v && !urls.has(v)) urls.set(v, isSrcset); };
 
         for (const img of Array.from(document.querySelectorAll('img'))) {
-          const src = img.getAttribute('src') || '';
-          const dataSrc = img.getAttribute('data-src') || img.getAttribute('data-lazy-src') || '';
-          const srcset = img.getAttribute('srcset') || '';
-          if (src) urls.add(src);
-          if (dataSrc) urls.add(dataSrc);
-          if (srcset) urls.add(srcset);
+          add(img.getAttribute('src') || '', false);
+          add(img.getAttribute('data-src') || img.getAttribute('data-lazy-src') || '', false);
+          add(img.getAttribute('srcset') || '', true);
         }
 
         for (const s of Array.from(document.querySelectorAll('picture source'))) {
-          const srcset = s.getAttribute('srcset') || '';
-          if (srcset) urls.add(srcset);
+          add(s.getAttribute('srcset') || '', true);
         }
 
-        return Array.from(urls);
+        return Array.from(urls.entries());
       }
     """)
 
     out = set()
-    for item in raw:
-        if not item:
-            continue
+    for item, is_srcset in raw:
         item = str(item).strip()
 
-        if "," in item and ("w" in item or "x" in item):
-            best = pick_largest_from_srcset(item)
-            best = normalize_img_url(best)
-            if best:
-                out.add(best)
+        if is_srcset or min_width > 0:
+            width, u = largest_srcset_candidate(item)
+            if width < min_width:
+                continue
         else:
-            u = normalize_img_url(item)
-            if u:
-                out.add(u)
+            u = item
 
-    cleaned = []
-    for u in out:
-        low = u.lower()
+        # Cheap prefix check before any URL work
+        low = u[:5].lower()
         if low.startswith("data:") or low.startswith("blob:"):
             continue
-        cleaned.append(u)
 
-    cleaned.sort()
-    return cleaned
+        u = normalize_img_url(u)
+        if u:
+            out.add(u)
 
+    return sorted(out)
 
-def guess_story_title_date(page) -> tuple[str, str]:
-    title = "Untitled"
-    date_str = ""
 
+def guess_story_title_date(page) -> tuple[str, str]:
+    # One round-trip: the h1 text, every text node (DOM order) and the
+    # innerText of its parent element. The date is the parent text of the first
+    # node mentioning a month -- the smallest element containing it, like the
+    # old text-regex locator -- matched with _DATE_RE in Python (no 3s wait).
     try:
-        title = page.locator("h1").first.inner_text(timeout=8000).strip() or "Untitled"
+        h1_text, nodes, el_texts = page.evaluate("""
+          () => {
+            const h1 = document.querySelector('h1');
+            const nodes = [];
+            const elTexts = [];
+            const elIdx = new Map();
+            const walker = document.createTreeWalker(document.body || document, NodeFilter.SHOW_TEXT);
+            for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+              const el = n.parentElement;
+              if (!el || !n.nodeValue.trim()) continue;
+              if (['SCRIPT', 'STYLE', 'NOSCRIPT'].includes(el.tagName)) continue;
+              if (!elIdx.has(el)) {
+                elIdx.set(el, elTexts.length);
+                elTexts.push(el.innerText || '');
+              }
+              nodes.push([n.nodeValue, elIdx.get(el)]);
+            }
+            return [h1 ? h1.innerText : '', nodes, elTexts];
+          }
+        """)
     except Exception:
-        pass
+        return "Untitled", ""
 
-    try:
-        date_candidate = page.locator(
-            "text=/\\b(Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|Sept|September|Oct|October|Nov|November|Dec|December)\\b/i"
-        ).first
-        date_str = date_candidate.inner_text(timeout=3000).strip()
-        if len(date_str) > 40:
-            date_str = date_str[:40].strip()
-    except Exception:
-        date_str = ""
+    title = (h1_text or "").strip() or "Untitled"
+
+    date_str = ""
+    for value, idx in nodes:
+        if _DATE_RE.search(value):
+            date_str = el_texts[idx].strip()
+            if len(date_str) > 40:
+                date_str = date_str[:40].strip()
+            break
 
     return title, date_str
 
 
+def make_http_client(context) -> httpx.Client:
+    """
+    Plain HTTP client carrying the browser session's cookies.
+    Used for image downloads so they can run concurrently (the sync
+    Playwright API can't be shared across threads).
+    """
+    cookies = httpx.Cookies()
+    for c in context.cookies():
+        cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+    return httpx.Client(cookies=cookies, follow_redirects=True, timeout=120.0)
+
+
+def download_file_via_http(client: httpx.Client, url: str, dest_path: pathlib.Path) -> bool:
+    try:
+        resp = client.get(url)
+        if resp.status_code != 200:
+            return False
+        dest_path.write_bytes(resp.content)
+        return True
+    except Exception:
+        return False
+
+
 def download_file_via_context(context, url: str, dest_path: pathlib.Path) -> bool:
     try:
         resp = context.request.get(url, timeout=120_000)
@@ -522,40 +656,32 @@ def collect_fullsize_urls_via_lightbox(page) -> list[str]:
     ]
 
     thumbs = None
+    chosen_sel = ""
     for sel in thumb_selectors:
         loc = page.locator(sel)
         if loc.count() > 0:
             thumbs = loc
+            chosen_sel = sel
             break
 
-    if thumbs is None or thumbs.count() == 0:
+    if thumbs is None:
         return []
 
-    candidate_indices = []
-    count = thumbs.count()
-    for i in range(count):
-        try:
-            el = thumbs.nth(i)
-            box = el.bounding_box()
-            if not box:
-                continue
-            if box["width"] < 120 or box["height"] < 90:
-                continue
-            src = (el.get_attribute("src") or "") + " " + (el.get_attribute("srcset") or "")
-            src = src.lower()
-            if "unithistory" in src or "blob.core.windows.net" in src or "image" in src:
-                candidate_indices.append(i)
-            else:
-                candidate_indices.append(i)
-        except Exception:
-            continue
+    # One round-trip for every thumbnail's size (instead of bounding_box() per element)
+    try:
+        thumbs_meta = page.evaluate("""
+          (sel) => Array.from(document.querySelectorAll(sel)).map((e, i) => {
+            const r = e.getBoundingClientRect();
+            return { i, w: r.width, h: r.height };
+          })
+        """, chosen_sel)
+    except Exception:
+        return []
 
-    seen = set()
-    ordered = []
-    for i in candidate_indices:
-        if i not in seen:
-            seen.add(i)
-            ordered.append(i)
+    ordered = [
+        m["i"] for m in thumbs_meta
+        if m["w"] >= 120 and m["h"] >= 90
+    ]
 
     full_urls = []
     for idx in ordered:
@@ -602,24 +728,28 @@ def collect_fullsize_urls_via_lightbox(page) -> list[str]:
             _try_close_lightbox(page)
             continue
 
-    upgraded = [strip_downscaling_params(u) for u in full_urls]
+    return _dedupe_upgraded(full_urls)
+
 
+def _dedupe_upgraded(urls: list[str]) -> list[str]:
+    """Strip downscaling params, then de-duplicate (order preserved)."""
     seen = set()
     out = []
-    for u in upgraded:
+    for u in urls:
+        u = strip_downscaling_params(u)
         if u and u not in seen:
             seen.add(u)
             out.append(u)
     return out
 
 
-def download_current_story(page, context, out_root: pathlib.Path) -> dict:
+def download_current_story(page, context, client: httpx.Client, out_root: pathlib.Path) -> dict:
     try:
         page.wait_for_selector("h1", timeout=45_000)
     except PWTimeoutError:
         save_debug(page, tag="story_no_h1")
 
-    scroll_to_load(page, max_scrolls=18, pause_ms=350)
+    scroll_to_load(page)
 
     title, date_str = guess_story_title_date(page)
     folder_base = safe_name(title)
@@ -643,19 +773,16 @@ def download_current_story(page, context, out_root: pathlib.Path) -> dict:
 
     ensure_dir(story_folder)
 
-    # 1) Best attempt: fullsize via lightbox
-    image_urls = collect_fullsize_urls_via_lightbox(page)
+    # 1) Cheapest: the DOM srcsets already publish full-size variants
+    image_urls = _dedupe_upgraded(extract_image_urls_from_dom(page, min_width=FULLSIZE_MIN_WIDTH))
 
-    # 2) Fallback: DOM scrape
+    # 2) Otherwise: fullsize via lightbox (clicks every thumbnail; slow)
     if not image_urls:
-        dom_urls = extract_image_urls_from_dom(page)
-        dom_urls = [strip_downscaling_params(u) for u in dom_urls]
-        seen = set()
-        image_urls = []
-        for u in dom_urls:
-            if u and u not in seen:
-                seen.add(u)
-                image_urls.append(u)
+        image_urls = collect_fullsize_urls_via_lightbox(page)
+
+    # 3) Fallback: DOM scrape
+    if not image_urls:
+        image_urls = _dedupe_upgraded(extract_image_urls_from_dom(page))
 
     meta = {
         "final_url": page.url,
@@ -668,13 +795,20 @@ def download_current_story(page, context, out_root: pathlib.Path) -> dict:
 
     print(f"🗂️  Story: {title} ({len(image_urls)} images)")
 
+    jobs = []
     for idx, img_url in enumerate(image_urls, start=1):
         ext = file_ext_from_url(img_url)
-        fname = f"{idx:03d}{ext}"
-        dest = story_folder / fname
+        jobs.append((idx, img_url, story_folder / f"{idx:03d}{ext}"))
+
+    # Downloads are pure IO: fetch them concurrently, bounded by DOWNLOAD_WORKERS
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        results = list(pool.map(lambda j: download_file_via_http(client, j[1], j[2]), jobs))
+
+    for (idx, img_url, dest), ok in zip(jobs, results):
+        fname = dest.name
 
-        ok = download_file_via_context(context, img_url, dest)
         if not ok:
+            # Retry once through the browser context
             page.wait_for_timeout(600)
             ok = download_file_via_context(context, img_url, dest)
 
@@ -690,8 +824,7 @@ def download_current_story(page, context, out_root: pathlib.Path) -> dict:
         else:
             print(f"  ⚠️  FAILED {fname}  ({img_url})")
 
-    with open(story_folder / "story.json", "w", encoding="utf-8") as f:
-        json.dump(meta, f, ensure_ascii=False, indent=2)
+    write_json(story_folder / "story.json", meta)
 
     return meta
 
@@ -723,6 +856,7 @@ def main():
         context.close()
         context = browser.new_context(storage_state=storage_state_path)
         page = context.new_page()
+        client = make_http_client(context)
 
         # Open grid
         open_story_grid(page)
@@ -733,6 +867,10 @@ def main():
             save_debug(page, tag="zero_cards")
             raise RuntimeError("Found zero cards; selector is wrong or page didn't load.")
 
+        # Collect everything we need from the grid once, then visit stories directly
+        card_titles = get_card_titles(page)
+        card_hrefs = get_story_card_hrefs(page)
+
         all_meta = []
         processed = 0
         skipped = 0
@@ -740,41 +878,30 @@ def main():
         for i in range(total):
             print(f"\n=== [{i+1}/{total}] ===")
 
-            open_story_grid(page)
-
-            cards = page.locator(STORY_CARD_SELECTOR)
-            if i >= cards.count():
-                print("⚠️  Card count changed after reload; stopping.")
-                break
+            card_title = card_titles[i] if i < len(card_titles) else "Untitled"
+            href = card_hrefs[i] if i < len(card_hrefs) else ""
 
-            card = cards.nth(i)
-            card_title = get_card_title(card)
-            print(f"📌 Clicking card: {card_title}")
-
-            clicked = False
-            try:
-                card.click(timeout=20_000)
-                clicked = True
-            except Exception:
-                pass
-
-            if not clicked:
+            if href:
+                print(f"📌 Opening story: {card_title}")
                 try:
-                    card.locator("a").first.click(timeout=20_000)
-                    clicked = True
+                    page.goto(href, wait_until="domcontentloaded", timeout=120_000)
+                    opened = True
                 except Exception:
-                    pass
+                    opened = False
+            else:
+                print(f"📌 Clicking card: {card_title}")
+                opened = open_story_by_click(page, i)
 
-            if not clicked:
-                save_debug(page, tag=f"cannot_click_card_{i+1}")
-                print("❌ Could not click card; skipping.")
+            if not opened:
+                save_debug(page, tag=f"cannot_open_story_{i+1}")
+                print("❌ Could not open story; skipping.")
                 continue
 
             if is_login_page(page):
                 save_debug(page, tag=f"login_bounce_story_{i+1}")
                 raise RuntimeError("Bounced to login mid-run. Auth is not valid (or challenge/verification triggered).")
 
-            meta = download_current_story(page, context, out_root)
+            meta = download_current_story(page, context, client, out_root)
             meta["grid_title_guess"] = card_title
             all_meta.append(meta)
 
@@ -796,12 +923,16 @@ def main():
         }
 
         ensure_dir(pathlib.Path(MANIFEST_PATH).parent)
-        with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        write_json(MANIFEST_PATH, manifest)
 
-        # Optional zip (handy for manual download too)
-        zip_folder(out_root, ZIP_NAME)
+        # Optional zip (handy for manual download too).
+        # Only new story folders change OUT_DIR, so a run that saved none can keep the old zip.
+        if processed == 0 and os.path.isfile(ZIP_NAME):
+            print("📦 zip up to date; skipping")
+        else:
+            zip_folder(out_root, ZIP_NAME)
 
+        client.close()
         context.close()
         browser.close()
 